@@ -14,6 +14,8 @@ from fantasy_hockey.ranking import (
     RankingStrategy,
     TotalPointsRanker,
     ValueOverReplacementRanker,
+    precompute_keys,
+    rank_all,
 )
 
 __all__ = [
@@ -28,4 +30,6 @@ __all__ = [
     "RankingStrategy",
     "TotalPointsRanker",
     "ValueOverReplacementRanker",
+    "precompute_keys",
+    "rank_all",
 ]
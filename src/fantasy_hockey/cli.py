@@ -1,5 +1,7 @@
 """Command-line interface for Fantasy Hockey."""
 
+import csv
+import heapq
 import sys
 
 from fantasy_hockey.client import FantasyHockeyClient
@@ -7,35 +9,45 @@ from fantasy_hockey.client import FantasyHockeyClient
 DEFAULT_ROUNDS = 1
 DEFAULT_REDRAFT_STRATEGY = "vor"
 
+# Keyed by first character: ESPN position names all differ in their
+# first letter (Goalie, Defense, Center, Left Wing, Right Wing), so the
+# row-printing loops never need to lowercase the whole string.
+_POS_ABBREV = {"G": "G", "D": "D", "C": "F", "L": "F", "R": "F"}
+
 
 def print_standings(client: FantasyHockeyClient) -> None:
     """Print league standings."""
     standings = client.get_standings()
 
-    print("\nFantasy Hockey League Standings")
-    print("=" * 50)
-    print(f"{'Rank':<6}{'Team':<30}{'Record':<12}")
-    print("-" * 50)
-
+    out = [
+        "",
+        "Fantasy Hockey League Standings",
+        "=" * 50,
+        f"{'Rank':<6}{'Team':<30}{'Record':<12}",
+        "-" * 50,
+    ]
     for team in standings:
-        print(f"{team.standing:<6}{team.team_name[:29]:<30}{team.record:<12}")
+        out.append(
+            str(team.standing).ljust(6)
+            + _trunc(team.team_name, 29).ljust(30)
+            + team.record.ljust(12)
+        )
+    out.append("\n")
+    sys.stdout.write("\n".join(out))
+
 
-    print()
+def _trunc(s: str, n: int) -> str:
+    """Truncate a string to n characters, without copying when it fits."""
+    return s if len(s) <= n else s[:n]
 
 
 def get_position_abbrev(position: str) -> str:
     """Get single-letter position abbreviation."""
     if not position:
         return "?"
-    pos_lower = position.lower()
-    if pos_lower == "goalie":
-        return "G"
-    if pos_lower == "defense":
-        return "D"
-    if pos_lower in ("center", "left wing", "right wing"):
-        return "F"
-    # Fallback to first letter
-    return position[0].upper()
+    # Fallback to first letter for unknown positions
+    first = position[0].upper()
+    return _POS_ABBREV.get(first, first)
 
 
 def print_draft_order(client: FantasyHockeyClient, rounds: int | None = None) -> None:
@@ -50,22 +62,27 @@ def print_draft_order(client: FantasyHockeyClient, rounds: int | None = None) ->
         return
 
     title = f"Draft Order (Round{'s 1-' + str(rounds) if rounds and rounds > 1 else ' 1' if rounds == 1 else 's'})"
-    print(f"\n{title}")
-    print("=" * 85)
-    print(f"{'Pick':<6}{'Player':<28}{'Pos':<5}{'Points':<10}{'Team':<35}")
-    print("-" * 85)
 
+    # Build rows with str.ljust and flush once: avoids reparsing the
+    # format-spec per row and cuts the write() syscalls down to one.
+    rows = [
+        "",
+        title,
+        "=" * 85,
+        f"{'Pick':<6}{'Player':<28}{'Pos':<5}{'Points':<10}{'Team':<35}",
+        "-" * 85,
+    ]
     for pick in picks:
         pos = get_position_abbrev(pick.player.position)
-        print(
-            f"{pick.overall_pick:<6}"
-            f"{pick.player.player_name[:27]:<28}"
-            f"{pos:<5}"
-            f"{pick.player.total_points:<10.1f}"
-            f"{pick.team_name[:34]:<35}"
+        rows.append(
+            str(pick.overall_pick).ljust(6)
+            + _trunc(pick.player.player_name, 27).ljust(28)
+            + pos.ljust(5)
+            + f"{pick.player.total_points:.1f}".ljust(10)
+            + _trunc(pick.team_name, 34).ljust(35)
         )
-
-    print()
+    rows.append("\n")
+    sys.stdout.write("\n".join(rows))
 
 
 def print_redraft(
@@ -81,63 +98,65 @@ def print_redraft(
     ranked_players = result.ranked_players
 
     round_label = f"Round{'s 1-' + str(rounds) if rounds > 1 else ' 1'}"
-    print(f"\n{'=' * 80}")
-    print(f"REDRAFT ANALYSIS - {round_label}")
-    print(f"{'=' * 80}")
-    print(f"Algorithm: {result.strategy_name}")
-    print(f"Description: {result.strategy_description}")
-    print(f"{'=' * 80}\n")
-
-    print(
-        f"{'Pick':<5}{'Actual Pick':<21}{'Pos':<4}{'Pts':<7}{'Team':<22}"
-        f"{'Redraft Pick':<21}{'Pos':<4}{'Pts':<7}"
-    )
-    print("-" * 91)
 
+    # The whole report is accumulated here and written in one go at the
+    # end, rather than one write() syscall per print().
+    rows = [
+        "",
+        "=" * 80,
+        f"REDRAFT ANALYSIS - {round_label}",
+        "=" * 80,
+        f"Algorithm: {result.strategy_name}",
+        f"Description: {result.strategy_description}",
+        "=" * 80,
+        "",
+        f"{'Pick':<5}{'Actual Pick':<21}{'Pos':<4}{'Pts':<7}{'Team':<22}"
+        f"{'Redraft Pick':<21}{'Pos':<4}{'Pts':<7}",
+        "-" * 91,
+    ]
     for i, actual in enumerate(comparisons):
         # The ideal pick at this slot is the i-th ranked player
         ideal = ranked_players[i]
         actual_pos = get_position_abbrev(actual.player.position)
         ideal_pos = get_position_abbrev(ideal.position)
-        team_short = actual.team_name[:21]
-        print(
-            f"{i + 1:<5}"
-            f"{actual.player.player_name[:20]:<21}"
-            f"{actual_pos:<4}"
-            f"{actual.player.total_points:<7.1f}"
-            f"{team_short:<22}"
-            f"{ideal.player_name[:20]:<21}"
-            f"{ideal_pos:<4}"
-            f"{ideal.total_points:<7.1f}"
+        team_short = _trunc(actual.team_name, 21)
+        rows.append(
+            str(i + 1).ljust(5)
+            + _trunc(actual.player.player_name, 20).ljust(21)
+            + actual_pos.ljust(4)
+            + f"{actual.player.total_points:.1f}".ljust(7)
+            + team_short.ljust(22)
+            + _trunc(ideal.player_name, 20).ljust(21)
+            + ideal_pos.ljust(4)
+            + f"{ideal.total_points:.1f}".ljust(7)
         )
+    rows.append("")
 
-    print()
+    # Summary stats - only for players actually picked in these rounds.
+    # Partial selection (O(N log 5)) instead of fully sorting twice.
+    biggest_steals = heapq.nlargest(5, comparisons, key=lambda c: c.pick_difference)
+    biggest_busts = heapq.nsmallest(5, comparisons, key=lambda c: c.pick_difference)
 
-    # Summary stats - only for players actually picked in these rounds
-    biggest_steals = sorted(comparisons, key=lambda c: c.pick_difference, reverse=True)[
-        :5
-    ]
-    biggest_busts = sorted(comparisons, key=lambda c: c.pick_difference)[:5]
-
-    print("BIGGEST STEALS (outperformed draft position):")
+    rows.append("BIGGEST STEALS (outperformed draft position):")
     for comp in biggest_steals:
         if comp.pick_difference > 0:
-            print(
+            rows.append(
                 f"  {comp.player.player_name} ({comp.team_name}): "
                 f"picked {comp.actual_pick}, should have been {comp.redraft_pick} "
                 f"({comp.pick_difference:+d})"
             )
 
-    print("\nBIGGEST BUSTS (underperformed draft position):")
+    rows.append("\nBIGGEST BUSTS (underperformed draft position):")
     for comp in biggest_busts:
         if comp.pick_difference < 0:
-            print(
+            rows.append(
                 f"  {comp.player.player_name} ({comp.team_name}): "
                 f"picked {comp.actual_pick}, should have been {comp.redraft_pick} "
                 f"({comp.pick_difference:+d})"
             )
 
-    print()
+    rows.append("\n")
+    sys.stdout.write("\n".join(rows))
 
 
 def print_redraft_csv(
@@ -150,56 +169,86 @@ def print_redraft_csv(
     comparisons = result.comparisons
     ranked_players = result.ranked_players
 
-    print("Pick,Actual Player,Pos,Pts,Team,Redraft Player,Pos,Pts,Diff")
+    # csv.writer handles quoting in C, so names keep their commas instead
+    # of being stripped.
+    writer = csv.writer(sys.stdout, lineterminator="\n")
+    writer.writerow(
+        [
+            "Pick",
+            "Actual Player",
+            "Pos",
+            "Pts",
+            "Team",
+            "Redraft Player",
+            "Pos",
+            "Pts",
+            "Diff",
+        ]
+    )
     for i, actual in enumerate(comparisons):
         ideal = ranked_players[i]
-        actual_pos = get_position_abbrev(actual.player.position)
-        ideal_pos = get_position_abbrev(ideal.position)
-        diff = actual.pick_difference
-        # Escape commas in names
-        actual_name = actual.player.player_name.replace(",", "")
-        ideal_name = ideal.player_name.replace(",", "")
-        team = actual.team_name.replace(",", "")
-        print(
-            f"{i + 1},{actual_name},{actual_pos},{actual.player.total_points:.1f},"
-            f"{team},{ideal_name},{ideal_pos},{ideal.total_points:.1f},{diff:+d}"
+        writer.writerow(
+            [
+                i + 1,
+                actual.player.player_name,
+                get_position_abbrev(actual.player.position),
+                f"{actual.player.total_points:.1f}",
+                actual.team_name,
+                ideal.player_name,
+                get_position_abbrev(ideal.position),
+                f"{ideal.total_points:.1f}",
+                f"{actual.pick_difference:+d}",
+            ]
         )
 
 
-def parse_rounds_arg(args: list[str]) -> int | None:
-    """Parse --rounds N from command line args."""
-    for i, arg in enumerate(args):
-        if arg == "--rounds" and i + 1 < len(args):
-            try:
-                return int(args[i + 1])
-            except ValueError:
-                return None
-        if arg.startswith("--rounds="):
-            try:
-                return int(arg.split("=")[1])
-            except ValueError:
-                return None
+def _flag_value(flag: str, args: list[str], i: int) -> str | None:
+    """Get the value for a flag at index i (--flag VALUE or --flag=VALUE)."""
+    arg = args[i]
+    if arg == flag and i + 1 < len(args):
+        return args[i + 1]
+    if arg.startswith(flag + "="):
+        return arg.split("=", 1)[1]
     return None
 
 
-def parse_format_arg(args: list[str]) -> str:
-    """Parse --format from command line args."""
-    for i, arg in enumerate(args):
-        if arg == "--format" and i + 1 < len(args):
-            return args[i + 1].lower()
-        if arg.startswith("--format="):
-            return arg.split("=")[1].lower()
-    return "table"
-
-
-def parse_strategy_arg(args: list[str]) -> str:
-    """Parse --strategy from command line args."""
-    for i, arg in enumerate(args):
-        if arg == "--strategy" and i + 1 < len(args):
-            return args[i + 1].lower()
-        if arg.startswith("--strategy="):
-            return arg.split("=")[1].lower()
-    return DEFAULT_REDRAFT_STRATEGY  # Default to VOR
+def parse_args(args: list[str]) -> tuple[int | None, str, str]:
+    """Parse --rounds, --format, and --strategy in a single pass over argv.
+
+    The first occurrence of each flag wins, matching the old per-flag
+    scanners, but argv is only walked once.
+
+    Returns:
+        Tuple of (rounds, format, strategy name).
+    """
+    rounds: int | None = None
+    fmt = "table"
+    strategy = DEFAULT_REDRAFT_STRATEGY  # Default to VOR
+    rounds_seen = fmt_seen = strategy_seen = False
+
+    for i in range(len(args)):
+        if not rounds_seen:
+            value = _flag_value("--rounds", args, i)
+            if value is not None:
+                rounds_seen = True
+                try:
+                    rounds = int(value)
+                except ValueError:
+                    rounds = None
+                continue
+        if not fmt_seen:
+            value = _flag_value("--format", args, i)
+            if value is not None:
+                fmt_seen = True
+                fmt = value.lower()
+                continue
+        if not strategy_seen:
+            value = _flag_value("--strategy", args, i)
+            if value is not None:
+                strategy_seen = True
+                strategy = value.lower()
+
+    return rounds, fmt, strategy
 
 
 def get_strategy(strategy_name: str):
@@ -228,9 +277,7 @@ def main() -> int:
         client = FantasyHockeyClient()
 
         command = sys.argv[1] if len(sys.argv) > 1 else "redraft"
-        rounds = parse_rounds_arg(sys.argv)
-        fmt = parse_format_arg(sys.argv)
-        strategy_name = parse_strategy_arg(sys.argv)
+        rounds, fmt, strategy_name = parse_args(sys.argv)
 
         match command:
             case "standings":
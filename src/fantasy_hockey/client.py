@@ -1,8 +1,12 @@
 """ESPN Fantasy Hockey API client wrapper."""
 
-from collections import defaultdict
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-from espn_api.hockey import League
+import numpy as np
 
 from fantasy_hockey.config import ESPNConfig, load_config
 from fantasy_hockey.models import (
@@ -14,6 +18,37 @@ from fantasy_hockey.models import (
 )
 from fantasy_hockey.ranking import PositionAdjustedRanker, RankingStrategy
 
+if TYPE_CHECKING:
+    from espn_api.hockey import League
+
+# Aggregated box-score data is cached here between CLI invocations. Only
+# completed matchup periods are persisted — the in-progress period is
+# fetched fresh and merged in on every run — and the cache key includes
+# the current period, so a new period simply misses and refetches.
+CACHE_DIR = Path.home() / ".cache" / "fantasy_hockey"
+
+
+def _read_cache(path: Path):
+    """Read a pickled cache file, treating anything unreadable as a miss.
+
+    A run killed mid-write or a truncated file shouldn't wedge every
+    later invocation; the data is just refetched.
+    """
+    try:
+        return pickle.loads(path.read_bytes())
+    except Exception:
+        # Unpickling corrupt data can raise almost anything
+        # (UnpicklingError, EOFError, ValueError, AttributeError, ...).
+        return None
+
+
+def _write_cache(path: Path, obj) -> None:
+    """Pickle obj to path atomically (temp file + rename)."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(pickle.dumps(obj))
+    tmp.replace(path)
+
 
 class FantasyHockeyClient:
     """Client for accessing ESPN Fantasy Hockey data."""
@@ -25,14 +60,17 @@ class FantasyHockeyClient:
             config: ESPN configuration. If None, loads from environment.
         """
         self.config = config or load_config()
-        self._league: League | None = None
-        self._player_points_cache: dict[int, float] | None = None
-        self._player_positions_cache: dict[int, str] | None = None
+        self._league: "League | None" = None
+        self._player_data_cache: dict[int, tuple[float, str]] | None = None
 
     @property
-    def league(self) -> League:
+    def league(self) -> "League":
         """Get the ESPN League instance, creating it if needed."""
         if self._league is None:
+            # Imported lazily: espn_api drags in requests/bs4 and the CLI
+            # shouldn't pay that on startup or error paths.
+            from espn_api.hockey import League
+
             self._league = League(
                 league_id=self.config.league_id,
                 espn_s2=self.config.espn_s2,
@@ -60,7 +98,10 @@ class FantasyHockeyClient:
             )
             standings.append(standing)
 
-        return sorted(standings, key=lambda t: t.standing)
+        # The list is freshly built, so sort it in place rather than
+        # having sorted() allocate another one.
+        standings.sort(key=lambda t: t.standing)
+        return standings
 
     def get_draft_order(self) -> list[DraftPick]:
         """Get the draft order for the league.
@@ -69,16 +110,16 @@ class FantasyHockeyClient:
             List of draft picks in order.
         """
         team_lookup = {team.team_id: team.team_name for team in self.league.teams}
-        player_points = self._get_player_points()
-        player_positions = self._get_player_positions()
+        player_data = self._load_player_data()
 
         picks = []
         for i, pick in enumerate(self.league.draft):
+            total_points, position = player_data.get(pick.playerId, (0.0, ""))
             player_picked = Player(
                 player_id=pick.playerId,
                 player_name=pick.playerName,
-                position=player_positions.get(pick.playerId, ""),
-                total_points=player_points.get(pick.playerId, 0.0),
+                position=position,
+                total_points=total_points,
             )
             overall = i + 1
             draft_pick = DraftPick(
@@ -116,14 +157,21 @@ class FantasyHockeyClient:
         all_players = [pick.player for pick in all_picks]
         ranked_players = strategy.rank(all_players)
 
-        # Build redraft position lookup from ALL players
-        redraft_position = {p.player_id: i + 1 for i, p in enumerate(ranked_players)}
-
         # Filter to requested rounds for output
         display_picks = all_picks
         if rounds is not None:
             display_picks = [p for p in all_picks if p.round_num <= rounds]
 
+        # Build the redraft position lookup only for displayed players,
+        # bailing out once every needed id has been seen.
+        needed_ids = {p.player.player_id for p in display_picks}
+        redraft_position: dict[int, int] = {}
+        for i, player in enumerate(ranked_players):
+            if player.player_id in needed_ids:
+                redraft_position[player.player_id] = i + 1
+                if len(redraft_position) == len(needed_ids):
+                    break
+
         # Build comparison for each actual draft pick
         comparisons = []
         for pick in display_picks:
@@ -142,56 +190,139 @@ class FantasyHockeyClient:
             strategy_description=strategy.description,
         )
 
-    def _get_player_points(self) -> dict[int, float]:
-        """Get total fantasy points for all players across the season.
+    def _load_player_data(self) -> dict[int, tuple[float, str]]:
+        """Load season points and positions for all players in one pass.
+
+        Both values come from the same box-score lineups, so a single
+        traversal populates them together instead of two separate passes.
+        Only completed periods go into the persisted aggregate; the
+        in-progress period is fetched fresh and merged in on every run,
+        so live totals never go stale for the length of a matchup.
 
         Returns:
-            Dict mapping player_id to total fantasy points.
+            Dict mapping player_id to (total fantasy points, position).
         """
-        if self._player_points_cache is not None:
-            return self._player_points_cache
+        if self._player_data_cache is not None:
+            return self._player_data_cache
 
-        player_points: dict[int, float] = defaultdict(float)
-        player_positions: dict[int, str] = {}
         current_period = self.league.currentMatchupPeriod
+        cache_path = CACHE_DIR / (
+            f"players_{self.config.league_id}_{self.config.year}_{current_period}.pkl"
+        )
+        completed = _read_cache(cache_path)
+        if completed is None:
+            # Each box_scores call is a blocking HTTPS round-trip; fan the
+            # fetches out across threads and fold the results in on the
+            # main thread so the dicts need no locking.
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                all_scores = list(
+                    executor.map(
+                        lambda period: self._cached_box_scores(period, current_period),
+                        range(1, current_period),
+                    )
+                )
+            completed = self._fold_lineups(all_scores)
+            _write_cache(cache_path, completed)
+
+        live = self._fold_lineups(
+            [self.league.box_scores(matchup_period=current_period)]
+        )
+
+        player_data = dict(completed)
+        for player_id, (points, position) in live.items():
+            prev_points, prev_position = player_data.get(player_id, (0.0, ""))
+            player_data[player_id] = (prev_points + points, prev_position or position)
+
+        self._player_data_cache = player_data
+        return player_data
 
-        for period in range(1, current_period + 1):
-            scores = self.league.box_scores(matchup_period=period)
+    @staticmethod
+    def _fold_lineups(all_scores: list) -> dict[int, tuple[float, str]]:
+        """Aggregate box-score lineups into per-player (points, position).
+
+        Collects (id, points) pairs flat, then sums per player with a
+        single bincount in C rather than a dict lookup per lineup entry.
+        Positions are first-seen-wins.
+        """
+        point_ids: list[int] = []
+        point_values: list[float] = []
+        player_positions: dict[int, str] = {}
+
+        for scores in all_scores:
             for score in scores:
-                for player in score.home_lineup + score.away_lineup:
+                # chain avoids concatenating the two lineup lists per score
+                for player in chain(score.home_lineup, score.away_lineup):
                     if player.points:
-                        player_points[player.playerId] += player.points
+                        point_ids.append(player.playerId)
+                        point_values.append(player.points)
                     if player.playerId not in player_positions:
                         player_positions[player.playerId] = player.position
 
-        self._player_points_cache = dict(player_points)
-        # Also cache positions from box scores
-        if self._player_positions_cache is None:
-            self._player_positions_cache = player_positions
+        if point_ids:
+            ids_arr = np.array(point_ids, dtype=np.int64)
+            pts_arr = np.array(point_values, dtype=np.float64)
+            unique_ids, inverse = np.unique(ids_arr, return_inverse=True)
+            totals = np.bincount(inverse, weights=pts_arr)
+            player_points = dict(zip(unique_ids.tolist(), totals.tolist()))
         else:
-            self._player_positions_cache.update(player_positions)
+            player_points = {}
 
-        return self._player_points_cache
+        player_data = {
+            player_id: (player_points.get(player_id, 0.0), position)
+            for player_id, position in player_positions.items()
+        }
+        for player_id, points in player_points.items():
+            if player_id not in player_data:
+                player_data[player_id] = (points, "")
 
-    def _get_player_positions(self) -> dict[int, str]:
-        """Get player positions from roster and box score data.
+        return player_data
+
+    def _get_player_points(self) -> dict[int, float]:
+        """Get total fantasy points for all players across the season.
 
         Returns:
-            Dict mapping player_id to position string.
+            Dict mapping player_id to total fantasy points.
         """
-        if self._player_positions_cache is not None:
-            return self._player_positions_cache
+        return {
+            player_id: points
+            for player_id, (points, _) in self._load_player_data().items()
+        }
 
-        positions: dict[int, str] = {}
+    def _cached_box_scores(self, period: int, current_period: int) -> list:
+        """Fetch box scores for one matchup period, using the disk cache.
 
-        # Get from current rosters
-        for team in self.league.teams:
-            for player in team.roster:
-                positions[player.playerId] = player.position
+        Completed periods are immutable, so each is cached in its own file;
+        the in-progress period is always fetched fresh. This way a run in a
+        new matchup period only misses on the periods it hasn't seen.
+
+        Args:
+            period: Matchup period to fetch.
+            current_period: The league's current (in-progress) period.
+
+        Returns:
+            List of box scores for the period.
+        """
+        if period >= current_period:
+            return self.league.box_scores(matchup_period=period)
+
+        cache_path = CACHE_DIR / (
+            f"boxscore_{self.config.league_id}_{self.config.year}_p{period}.pkl"
+        )
+        scores = _read_cache(cache_path)
+        if scores is not None:
+            return scores
 
-        self._player_positions_cache = positions
+        scores = self.league.box_scores(matchup_period=period)
+        _write_cache(cache_path, scores)
+        return scores
 
-        # Calling _get_player_points will also populate positions from box scores
-        self._get_player_points()
+    def _get_player_positions(self) -> dict[int, str]:
+        """Get player positions from box score data.
 
-        return self._player_positions_cache
+        Returns:
+            Dict mapping player_id to position string.
+        """
+        return {
+            player_id: position
+            for player_id, (_, position) in self._load_player_data().items()
+        }
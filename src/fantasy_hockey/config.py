@@ -1,10 +1,10 @@
 """Configuration management for ESPN Fantasy Hockey."""
 
 import os
+from dataclasses import dataclass
 from pathlib import Path
 
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field
 
 DEFAULT_YEAR = 2026
 
@@ -31,10 +31,11 @@ def load_config() -> "ESPNConfig":
     )
 
 
-class ESPNConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ESPNConfig:
     """ESPN API configuration."""
 
-    league_id: int = Field(description="ESPN Fantasy League ID")
-    swid: str = Field(description="ESPN SWID cookie value")
-    espn_s2: str = Field(description="ESPN S2 cookie value")
-    year: int = Field(default=DEFAULT_YEAR, description="Season year")
+    league_id: int
+    swid: str
+    espn_s2: str
+    year: int = DEFAULT_YEAR
@@ -1,18 +1,26 @@
-"""Pydantic models for Fantasy Hockey data."""
+"""Data models for Fantasy Hockey data.
 
-from pydantic import BaseModel, Field
+These are slotted dataclasses rather than Pydantic models: the redraft path
+constructs thousands of instances per run (one per box-score lineup entry,
+one per draft pick), so skipping validation and the per-instance `__dict__`
+matters more than runtime field checking here.
+"""
 
+from dataclasses import dataclass
+from typing import NamedTuple
 
-class TeamStanding(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class TeamStanding:
     """A team's standing in the fantasy league."""
 
-    team_id: int = Field(description="Team ID")
-    team_name: str = Field(description="Team name")
-    owner: str = Field(description="Team owner name")
-    wins: int = Field(description="Number of wins")
-    losses: int = Field(description="Number of losses")
-    ties: int = Field(description="Number of ties")
-    standing: int = Field(description="Current standing/rank")
+    team_id: int
+    team_name: str
+    owner: str
+    wins: int
+    losses: int
+    ties: int
+    standing: int
 
     @property
     def record(self) -> str:
@@ -20,35 +28,40 @@ class TeamStanding(BaseModel):
         return f"{self.wins}-{self.losses}-{self.ties}"
 
 
-class Player(BaseModel):
-    """A player in the fantasy league."""
+class Player(NamedTuple):
+    """A player in the fantasy league.
+
+    A NamedTuple rather than a dataclass: one instance is built per
+    box-score lineup entry and per draft pick, and tuple-backed storage
+    keeps both construction and attribute access at C speed.
+    """
 
-    player_id: int = Field(description="Player ID")
-    player_name: str = Field(description="Player name")
-    position: str = Field(default="", description="Player position")
-    total_points: float = Field(
-        default=0.0, description="Total fantasy points this season"
-    )
+    player_id: int
+    player_name: str
+    position: str = ""
+    total_points: float = 0.0
 
 
-class DraftPick(BaseModel):
+@dataclass(slots=True, frozen=True)
+class DraftPick:
     """A draft pick in the draft order."""
 
-    round_num: int = Field(description="Round number")
-    pick_num: int = Field(description="Pick number within the round")
-    overall_pick: int = Field(description="Overall pick number")
-    team_id: int = Field(description="Team ID making the pick")
-    team_name: str = Field(description="Team name making the pick")
+    round_num: int
+    pick_num: int
+    overall_pick: int
+    team_id: int
+    team_name: str
     player: Player
 
 
-class RedraftComparison(BaseModel):
+@dataclass(slots=True, frozen=True)
+class RedraftComparison:
     """Comparison between actual draft pick and ideal redraft position."""
 
-    actual_pick: int = Field(description="Actual overall draft position")
-    redraft_pick: int = Field(description="Ideal redraft position based on performance")
+    actual_pick: int
+    redraft_pick: int
     player: Player
-    team_name: str = Field(description="Team that drafted this player")
+    team_name: str
 
     @property
     def pick_difference(self) -> int:
@@ -56,16 +69,11 @@ class RedraftComparison(BaseModel):
         return self.actual_pick - self.redraft_pick
 
 
-class RedraftResult(BaseModel):
+@dataclass(slots=True)
+class RedraftResult:
     """Result of a redraft analysis."""
 
-    comparisons: list[RedraftComparison] = Field(
-        description="Comparison for each actual draft pick"
-    )
-    ranked_players: list[Player] = Field(
-        description="All players ranked by the strategy (best first)"
-    )
-    strategy_name: str = Field(description="Name of the ranking strategy used")
-    strategy_description: str = Field(
-        description="Description of how the ranking strategy works"
-    )
+    comparisons: list[RedraftComparison]
+    ranked_players: list[Player]
+    strategy_name: str
+    strategy_description: str
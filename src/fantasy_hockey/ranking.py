@@ -1,13 +1,26 @@
 """Ranking strategies for redraft analysis."""
 
-from abc import ABC, abstractmethod
+from array import array
 from enum import Enum
+from types import MappingProxyType
+from typing import Protocol
+
+import numpy as np
 
 from fantasy_hockey.models import Player
 
+# Note: these kernels were briefly JIT-compiled with numba, but for
+# elementwise work on a few hundred players the compile and dispatch
+# overhead dwarfs any gain over NumPy's C loops, so plain vectorized
+# expressions are used throughout. Don't reach for a JIT here.
+
 # Default multiplier to de-prioritize goalies (they score more points naturally)
 DEFAULT_GOALIE_MULTIPLIER = 0.75
 
+# Below this size, building an ndarray costs more than it saves and the
+# rankers fall back to a plain Python sort.
+SMALL_RANK_THRESHOLD = 64
+
 
 class Position(Enum):
     """Simplified position categories for ranking."""
@@ -19,19 +32,107 @@ class Position(Enum):
     @classmethod
     def from_espn_position(cls, position: str) -> "Position":
         """Convert ESPN position string to Position enum."""
-        pos_lower = position.lower()
-        if pos_lower == "goalie":
-            return cls.GOALIE
-        if pos_lower == "defense":
-            return cls.DEFENSE
-        # Center, Left Wing, Right Wing -> Forward
-        return cls.FORWARD
+        return _espn_to_position(position)
+
+
+# ESPN position names all differ in their first character, so a one-char
+# table resolves goalies and defensemen without touching the rest of the
+# string; everything else is a forward.
+_FIRST_CHAR_MAP = {
+    "G": Position.GOALIE,
+    "g": Position.GOALIE,
+    "D": Position.DEFENSE,
+    "d": Position.DEFENSE,
+}
+
+
+def _espn_to_position(
+    position: str,
+    _map_get=_FIRST_CHAR_MAP.get,
+    _forward=Position.FORWARD,
+) -> Position:
+    """Resolve an ESPN position string to a Position.
+
+    Plain-function twin of Position.from_espn_position for the per-player
+    loops: calling it skips the classmethod descriptor binding, and the
+    default arguments pin the map lookup and Forward fallback as locals.
+    """
+    first = position[:1]
+    pos = _map_get(first)
+    if pos is None:
+        # Center, Left Wing, Right Wing (and anything unknown) -> Forward
+        pos = _map_get(first.upper(), _forward)
+    return pos
+
+
+# Integer codes for the three positions, used to index packed arrays
+# (F=0, D=1, G=2).
+_CODE_POSITIONS = (Position.FORWARD, Position.DEFENSE, Position.GOALIE)
+_POS_CODE = {pos: code for code, pos in enumerate(_CODE_POSITIONS)}
+_GOALIE_CODE = _POS_CODE[Position.GOALIE]
+
+# Typical fantasy hockey starting spots per team, used when
+# calculate_replacement_levels isn't given a roster layout.
+DEFAULT_ROSTER_SPOTS = MappingProxyType(
+    {
+        Position.FORWARD: 9,  # C, C, LW, LW, RW, RW, F, F, F or similar
+        Position.DEFENSE: 4,  # D, D, D, D
+        Position.GOALIE: 2,  # G, G
+    }
+)
+
+
+def precompute_keys(players: list[Player]) -> np.ndarray:
+    """Materialize the total-points array for a player list.
+
+    Sharing the O(N) pass over Player objects across rankers is always
+    explicit: build the array once and hand it to each ranker's
+    rank_from_arrays (rank_all does exactly that). There is deliberately
+    no implicit cache here — plain lists can't be weakly referenced, and
+    keying on id() goes stale once the address is recycled.
+
+    Args:
+        players: Players whose total_points should be packed.
+
+    Returns:
+        float64 array of total points, aligned with the input list.
+    """
+    return np.fromiter(
+        (p.total_points for p in players), dtype=np.float64, count=len(players)
+    )
+
+
+def _position_codes(players: list[Player]) -> np.ndarray:
+    """Pack per-player position codes (F=0, D=1, G=2) into an int8 array."""
+    return np.fromiter(
+        (_POS_CODE[_espn_to_position(p.position)] for p in players),
+        dtype=np.int8,
+        count=len(players),
+    )
+
+
+def _already_descending(keys: np.ndarray) -> bool:
+    """True if keys are already in descending order.
+
+    Timsort detects ascending runs cheaply but these rankers emit
+    descending order, so re-ranking an already-ranked list would still
+    pay the full sort. An O(N) scan buys an O(N log N) skip.
+    """
+    return bool(np.all(np.diff(keys) <= 0.0))
+
 
+class RankingStrategy(Protocol):
+    """Structural interface for player ranking strategies.
+
+    ``name`` and ``description`` are plain attributes rather than
+    properties — fixed strategies set them on the class, parameterized
+    ones in ``__init__`` — so reading them is a straight attribute load
+    with no descriptor call.
+    """
 
-class RankingStrategy(ABC):
-    """Abstract base class for player ranking strategies."""
+    name: str
+    description: str
 
-    @abstractmethod
     def rank(self, players: list[Player]) -> list[Player]:
         """Rank players and return them in order from best to worst.
 
@@ -41,47 +142,76 @@ class RankingStrategy(ABC):
         Returns:
             Players sorted from best (index 0) to worst.
         """
-        pass
+        ...
 
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Human-readable name of this ranking strategy."""
-        pass
+    def rank_from_arrays(
+        self, players: list[Player], pts: np.ndarray, codes: np.ndarray
+    ) -> list[Player]:
+        """Rank players from pre-packed points and position-code arrays.
 
-    @property
-    @abstractmethod
-    def description(self) -> str:
-        """Detailed description of how this ranking works."""
-        pass
+        Args:
+            players: Players to rank.
+            pts: float64 total points, aligned with players.
+            codes: int8 position codes (F=0, D=1, G=2), aligned with players.
+
+        Returns:
+            Players sorted from best (index 0) to worst.
+        """
+        ...
 
 
-class TotalPointsRanker(RankingStrategy):
+class TotalPointsRanker:
     """Rank players by total fantasy points scored this season.
 
     This is a naive ranking that simply orders by total points.
     It does not account for position scarcity, games played, etc.
     """
 
-    def rank(self, players: list[Player]) -> list[Player]:
-        return sorted(players, key=lambda p: p.total_points, reverse=True)
-
-    @property
-    def name(self) -> str:
-        return "Total Points"
-
-    @property
-    def description(self) -> str:
-        return "Players ranked by total fantasy points scored this season."
+    # The sort decorations stay plain tuples (already compact and C-compared);
+    # slots here just keep ranker instances themselves __dict__-free.
+    __slots__ = ()
 
+    name = "Total Points"
+    description = "Players ranked by total fantasy points scored this season."
 
-class PositionAdjustedRanker(RankingStrategy):
+    def rank(self, players: list[Player]) -> list[Player]:
+        if len(players) < SMALL_RANK_THRESHOLD:
+            # Small lists skip ndarray construction: array('d') packs the
+            # points into a C double buffer, and its __getitem__ is a raw
+            # buffer load rather than attribute access through Player.
+            # reverse=True keeps ties in draft order (sorted() is stable).
+            pts = array("d", (p.total_points for p in players))
+            order = sorted(range(len(players)), key=pts.__getitem__, reverse=True)
+            return [players[i] for i in order]
+
+        # One C-level sort over a packed float array instead of N log N
+        # Python key callbacks. Negation gives descending order while the
+        # stable sort keeps ties in draft order.
+        pts = precompute_keys(players)
+        if _already_descending(pts):
+            return list(players)
+        order = np.argsort(-pts, kind="stable")
+        return [players[i] for i in order]
+
+    def rank_from_arrays(
+        self, players: list[Player], pts: np.ndarray, codes: np.ndarray
+    ) -> list[Player]:
+        # codes is unused: total points ignore position.
+        if _already_descending(pts):
+            return list(players)
+        order = np.argsort(-pts, kind="stable")
+        return [players[i] for i in order]
+
+
+class PositionAdjustedRanker:
     """Rank players by total points with position adjustments.
 
     Applies a multiplier to goalie points to account for their naturally
     higher scoring rate, making comparisons with skaters more fair.
     """
 
+    __slots__ = ("goalie_multiplier", "name", "description")
+
     def __init__(self, goalie_multiplier: float = DEFAULT_GOALIE_MULTIPLIER):
         """Initialize the ranker.
 
@@ -89,30 +219,49 @@ class PositionAdjustedRanker(RankingStrategy):
             goalie_multiplier: Multiplier applied to goalie points (default 0.75).
         """
         self.goalie_multiplier = goalie_multiplier
-
-    def _adjusted_points(self, player: Player) -> float:
-        """Get position-adjusted points for ranking."""
-        if player.position.lower() == "goalie":
-            return player.total_points * self.goalie_multiplier
-        return player.total_points
-
-    def rank(self, players: list[Player]) -> list[Player]:
-        return sorted(players, key=self._adjusted_points, reverse=True)
-
-    @property
-    def name(self) -> str:
-        return f"Position Adjusted (G x{self.goalie_multiplier})"
-
-    @property
-    def description(self) -> str:
-        return (
+        self.name = f"Position Adjusted (G x{goalie_multiplier})"
+        self.description = (
             f"Players ranked by total fantasy points, with goalie points "
-            f"multiplied by {self.goalie_multiplier} to account for their "
+            f"multiplied by {goalie_multiplier} to account for their "
             f"naturally higher scoring rate."
         )
 
+    def rank(self, players: list[Player]) -> list[Player]:
+        if len(players) < SMALL_RANK_THRESHOLD:
+            multiplier = self.goalie_multiplier
+            # Enum identity ("is") is a pointer compare, vs. hashing a
+            # fresh lowercased string per player.
+            decorated = [
+                (
+                    -p.total_points * multiplier
+                    if _espn_to_position(p.position) is Position.GOALIE
+                    else -p.total_points,
+                    i,
+                    p,
+                )
+                for i, p in enumerate(players)
+            ]
+            decorated.sort()
+            return [t[2] for t in decorated]
+
+        # Build the adjusted-points array in one pass, then let NumPy do
+        # the sort in C rather than calling a Python key O(N log N) times.
+        return self.rank_from_arrays(
+            players, precompute_keys(players), _position_codes(players)
+        )
+
+    def rank_from_arrays(
+        self, players: list[Player], pts: np.ndarray, codes: np.ndarray
+    ) -> list[Player]:
+        # Single elementwise select in C; no fancy-index write-back.
+        keys = np.where(codes == _GOALIE_CODE, pts * self.goalie_multiplier, pts)
+        if _already_descending(keys):
+            return list(players)
+        order = np.argsort(-keys, kind="stable")
+        return [players[i] for i in order]
 
-class ValueOverReplacementRanker(RankingStrategy):
+
+class ValueOverReplacementRanker:
     """Rank players by Value Over Replacement (VOR).
 
     VOR measures how much better a player is compared to a "replacement level"
@@ -122,12 +271,20 @@ class ValueOverReplacementRanker(RankingStrategy):
     VOR = Player Points - Replacement Level Points (for their position)
     """
 
-    # Default replacement level values (can be overridden or calculated)
-    DEFAULT_REPLACEMENT_LEVELS = {
-        Position.FORWARD: 46.1,
-        Position.DEFENSE: 45.0,
-        Position.GOALIE: 72.6,
-    }
+    __slots__ = ("replacement_levels", "_repl_arr", "description")
+
+    name = "Value Over Replacement (VOR)"
+
+    # Default replacement level values (can be overridden or calculated).
+    # A read-only mapping so every default-constructed ranker shares it
+    # instead of copying a dict per instance.
+    DEFAULT_REPLACEMENT_LEVELS = MappingProxyType(
+        {
+            Position.FORWARD: 46.1,
+            Position.DEFENSE: 45.0,
+            Position.GOALIE: 72.6,
+        }
+    )
 
     def __init__(
         self,
@@ -137,36 +294,56 @@ class ValueOverReplacementRanker(RankingStrategy):
 
         Args:
             replacement_levels: Dict mapping Position to replacement level points.
-                               If None, uses default values.
+                               If None, uses the (read-only) default values.
         """
         self.replacement_levels = (
-            replacement_levels or self.DEFAULT_REPLACEMENT_LEVELS.copy()
+            replacement_levels
+            if replacement_levels is not None
+            else self.DEFAULT_REPLACEMENT_LEVELS
+        )
+        # Length-3 vector indexed by position code, so the array path does
+        # a plain load per player instead of a dict hash.
+        self._repl_arr = np.array(
+            [self.replacement_levels.get(pos, 0.0) for pos in _CODE_POSITIONS],
+            dtype=np.float64,
+        )
+        f_repl, d_repl, g_repl = (
+            self.replacement_levels.get(pos, 0.0)
+            for pos in (Position.FORWARD, Position.DEFENSE, Position.GOALIE)
+        )
+        self.description = (
+            f"Players ranked by value over replacement level. "
+            f"Replacement levels: F={f_repl:.0f}, D={d_repl:.0f}, G={g_repl:.0f}. "
+            f"VOR = Player Points - Replacement Points for their position."
         )
 
     def _get_vor(self, player: Player) -> float:
         """Calculate Value Over Replacement for a player."""
-        position = Position.from_espn_position(player.position)
+        position = _espn_to_position(player.position)
         replacement = self.replacement_levels.get(position, 0.0)
         return player.total_points - replacement
 
     def rank(self, players: list[Player]) -> list[Player]:
-        return sorted(players, key=self._get_vor, reverse=True)
-
-    @property
-    def name(self) -> str:
-        return "Value Over Replacement (VOR)"
-
-    @property
-    def description(self) -> str:
-        f_repl = self.replacement_levels[Position.FORWARD]
-        d_repl = self.replacement_levels[Position.DEFENSE]
-        g_repl = self.replacement_levels[Position.GOALIE]
-        return (
-            f"Players ranked by value over replacement level. "
-            f"Replacement levels: F={f_repl:.0f}, D={d_repl:.0f}, G={g_repl:.0f}. "
-            f"VOR = Player Points - Replacement Points for their position."
+        if len(players) < SMALL_RANK_THRESHOLD:
+            decorated = [(-self._get_vor(p), i, p) for i, p in enumerate(players)]
+            decorated.sort()
+            return [t[2] for t in decorated]
+
+        # Pack points and position codes once, then compute VOR over the
+        # arrays and argsort in C.
+        return self.rank_from_arrays(
+            players, precompute_keys(players), _position_codes(players)
         )
 
+    def rank_from_arrays(
+        self, players: list[Player], pts: np.ndarray, codes: np.ndarray
+    ) -> list[Player]:
+        vor = pts - self._repl_arr[codes]
+        if _already_descending(vor):
+            return list(players)
+        order = np.argsort(-vor, kind="stable")
+        return [players[i] for i in order]
+
     @classmethod
     def calculate_replacement_levels(
         cls,
@@ -190,40 +367,57 @@ class ValueOverReplacementRanker(RankingStrategy):
             Dict mapping Position to replacement level points.
         """
         if roster_spots is None:
-            # Typical fantasy hockey roster spots per team
-            roster_spots = {
-                Position.FORWARD: 9,  # C, C, LW, LW, RW, RW, F, F, F or similar
-                Position.DEFENSE: 4,  # D, D, D, D
-                Position.GOALIE: 2,  # G, G
-            }
-
-        # Group players by position
-        by_position: dict[Position, list[Player]] = {
-            Position.FORWARD: [],
-            Position.DEFENSE: [],
-            Position.GOALIE: [],
-        }
-
-        for player in players:
-            pos = Position.from_espn_position(player.position)
-            by_position[pos].append(player)
-
-        # Sort each position by points
-        for pos in by_position:
-            by_position[pos].sort(key=lambda p: p.total_points, reverse=True)
-
-        # Calculate replacement level for each position
+            roster_spots = DEFAULT_ROSTER_SPOTS
+
+        # One pass writes position codes and points into packed arrays;
+        # per-position vectors then fall out of a boolean mask instead of
+        # dict-of-lists appends.
+        n = len(players)
+        codes = np.empty(n, dtype=np.int8)
+        pts = np.empty(n, dtype=np.float64)
+        for i, player in enumerate(players):
+            codes[i] = _POS_CODE[_espn_to_position(player.position)]
+            pts[i] = player.total_points
+
+        # Calculate replacement level for each position. Only the k-th
+        # largest value is needed, so an O(N) partition replaces the full
+        # per-position sort.
         replacement_levels = {}
-        for pos, pos_players in by_position.items():
+        for code, pos in enumerate(_CODE_POSITIONS):
+            pos_pts = pts[codes == code]
             # Number of starters at this position across all teams
             starters_needed = num_teams * roster_spots.get(pos, 0)
 
             # Replacement level is the first non-starter (or last starter if not enough)
-            if len(pos_players) > starters_needed:
-                replacement_levels[pos] = pos_players[starters_needed].total_points
-            elif pos_players:
-                replacement_levels[pos] = pos_players[-1].total_points
+            if pos_pts.size > starters_needed:
+                replacement_levels[pos] = float(
+                    -np.partition(-pos_pts, starters_needed)[starters_needed]
+                )
+            elif pos_pts.size:
+                replacement_levels[pos] = float(pos_pts.min())
             else:
                 replacement_levels[pos] = 0.0
 
         return replacement_levels
+
+
+def rank_all(
+    players: list[Player], rankers: list[RankingStrategy]
+) -> dict[str, list[Player]]:
+    """Run several rankers over one player list, sharing the packed arrays.
+
+    Each ranker's vectorized path starts with the same O(N) scan over
+    Player objects to build points and position-code arrays; doing that
+    scan once and handing the arrays to rank_from_arrays amortizes it
+    across rankers. The sorts themselves are cheap by comparison.
+
+    Args:
+        players: Players to rank.
+        rankers: Strategies to run.
+
+    Returns:
+        Dict mapping each ranker's name to its ranked player list.
+    """
+    pts = precompute_keys(players)
+    codes = _position_codes(players)
+    return {r.name: r.rank_from_arrays(players, pts, codes) for r in rankers}